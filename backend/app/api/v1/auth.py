@@ -1,7 +1,11 @@
 """Authentication API endpoints."""
 
+import uuid
+
+from cachetools import TTLCache
 from fastapi import APIRouter, Response, status
 
+from app.db.session import on_commit
 from app.dependencies import CurrentUser, DbSession
 from app.schemas.common import Message
 from app.schemas.user import (
@@ -14,10 +18,13 @@ from app.schemas.user import (
     UserResponse,
     UserUpdate,
 )
-from app.services.auth_service import AuthService
+from app.services import auth_service
 
 router = APIRouter()
 
+# Serialized /me responses keyed by user id, dropped once a profile change commits
+_me_cache: TTLCache[uuid.UUID, bytes] = TTLCache(maxsize=10_000, ttl=10)
+
 
 @router.post(
     "/register",
@@ -36,8 +43,7 @@ async def register(
     - **username**: 3-100 characters, alphanumeric with underscores/hyphens
     - **password**: 8-100 characters, must contain uppercase, lowercase, and digit
     """
-    service = AuthService(db)
-    user, tokens = await service.register(data)
+    user, tokens = await auth_service.register(db, data)
 
     return AuthResponse(
         user=UserResponse.model_validate(user),
@@ -60,8 +66,7 @@ async def login(
 
     Returns access and refresh tokens. The refresh token is also set as an httpOnly cookie.
     """
-    service = AuthService(db)
-    user, tokens = await service.login(data)
+    user, tokens = await auth_service.login(db, data)
 
     # Set refresh token as httpOnly cookie for security
     response.set_cookie(
@@ -112,8 +117,7 @@ async def refresh_token(
 
     The refresh token is also rotated for security.
     """
-    service = AuthService(db)
-    tokens = await service.refresh_tokens(data.refresh_token)
+    tokens = await auth_service.refresh_tokens(db, data.refresh_token)
 
     # Update refresh token cookie
     response.set_cookie(
@@ -135,9 +139,13 @@ async def refresh_token(
 )
 async def get_current_user(
     user: CurrentUser,
-) -> UserResponse:
+) -> Response:
     """Get the currently authenticated user's profile."""
-    return UserResponse.model_validate(user)
+    body = _me_cache.get(user.id)
+    if body is None:
+        body = UserResponse.model_validate(user).model_dump_json().encode()
+        _me_cache[user.id] = body
+    return Response(content=body, media_type="application/json")
 
 
 @router.patch(
@@ -156,8 +164,8 @@ async def update_current_user(
     - **username**: New username (optional)
     - **settings**: User preferences JSON (optional)
     """
-    service = AuthService(db)
-    updated_user = await service.update_user(user, data)
+    updated_user = await auth_service.update_user(db, user, data)
+    on_commit(db, lambda: _me_cache.pop(user.id, None))
     return UserResponse.model_validate(updated_user)
 
 
@@ -176,6 +184,6 @@ async def change_password(
 
     Requires the current password for verification.
     """
-    service = AuthService(db)
-    await service.change_password(user, data.old_password, data.new_password)
+    await auth_service.change_password(db, user, data.old_password, data.new_password)
+    on_commit(db, lambda: _me_cache.pop(user.id, None))
     return Message(message="Password changed successfully")
@@ -1,42 +1,52 @@
 """System API endpoints for health checks and status."""
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from app.config import settings
 
 router = APIRouter()
 
+# Static payloads serialized once at import; settings do not change at runtime
+_HEALTH_BYTES = orjson.dumps(
+    {
+        "status": "healthy",
+        "version": "0.1.0",
+        "environment": settings.app_env,
+    }
+)
+
+_STATS_BYTES = orjson.dumps(
+    {
+        "documents_count": 0,
+        "tags_count": 0,
+        "collections_count": 0,
+        "storage_used_mb": 0,
+    }
+)
+
 
 @router.get(
     "/health",
     summary="Health check endpoint",
 )
-async def health_check() -> dict:
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring and load balancers.
 
     Returns the application status and version.
     """
-    return {
-        "status": "healthy",
-        "version": "0.1.0",
-        "environment": settings.app_env,
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @router.get(
     "/stats",
     summary="Get application statistics",
 )
-async def get_stats() -> dict:
+async def get_stats() -> Response:
     """
     Get basic application statistics.
 
     This is a placeholder that will be expanded with real stats.
     """
-    return {
-        "documents_count": 0,
-        "tags_count": 0,
-        "collections_count": 0,
-        "storage_used_mb": 0,
-    }
+    return Response(content=_STATS_BYTES, media_type="application/json")
@@ -1,6 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -31,9 +31,17 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 15
     jwt_refresh_token_expire_days: int = 7
+    # Concurrent password hash/verify threads; defaults to the CPU count
+    password_hash_workers: int | None = Field(default=None, ge=1)
 
     # Database
     database_url: str = "sqlite:///./data/pkm_vault.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_prepared_statement_cache_size: int = 1024  # asyncpg only
 
     # Embeddings
     embedding_provider: Literal["huggingface", "openai"] = "huggingface"
@@ -69,17 +77,17 @@ class Settings(BaseSettings):
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    @property
+    @cached_property
     def allowed_extensions_list(self) -> list[str]:
         """Get allowed extensions as a list."""
         return [ext.strip().lower() for ext in self.allowed_extensions.split(",")]
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
         """Get CORS origins as a list."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
-    @property
+    @cached_property
     def max_upload_size_bytes(self) -> int:
         """Get max upload size in bytes."""
         return self.max_upload_size_mb * 1024 * 1024
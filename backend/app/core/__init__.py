@@ -8,9 +8,13 @@ from app.core.exceptions import (
     UnauthorizedError,
 )
 from app.core.security import (
+    ahash_password,
+    averify_password,
     create_access_token,
     create_refresh_token,
+    get_token_subject,
     hash_password,
+    password_needs_rehash,
     verify_password,
     verify_token,
 )
@@ -21,9 +25,13 @@ __all__ = [
     "ForbiddenError",
     "NotFoundError",
     "UnauthorizedError",
+    "ahash_password",
+    "averify_password",
     "create_access_token",
     "create_refresh_token",
+    "get_token_subject",
     "hash_password",
+    "password_needs_rehash",
     "verify_password",
     "verify_token",
 ]
@@ -2,6 +2,9 @@
 
 from fastapi import HTTPException, status
 
+# Shared by every 401 response; treat as read-only
+_BEARER_HEADERS = {"WWW-Authenticate": "Bearer"}
+
 
 class AppException(HTTPException):
     """Base application exception."""
@@ -29,7 +32,7 @@ class UnauthorizedError(AppException):
         super().__init__(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=detail,
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_BEARER_HEADERS,
         )
 
 
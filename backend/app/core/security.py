@@ -1,25 +1,118 @@
 """Security utilities for authentication and authorization."""
 
+import hashlib
+import hmac
+import os
+import threading
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import anyio
+import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
+from jwt import InvalidTokenError
 
 from app.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Signing key encoded once; settings are not reloaded at runtime
+_SECRET_KEY_BYTES = settings.secret_key.encode("utf-8")
+
+# Argon2id with the OWASP-recommended m=46 MiB, t=2, p=1. bcrypt hashes
+# created before the switch still verify and are upgraded on the next login.
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=47104, parallelism=1)
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Password hashing runs in the anyio worker threads (argon2-cffi and bcrypt
+# release the GIL). A separate limiter caps how many of those threads it may
+# occupy so a login burst cannot starve other threadpool users. It is created
+# lazily because anyio limiters must be built inside a running event loop.
+_hash_limiter: anyio.CapacityLimiter | None = None
+
+# Recent successful password verifications. Keys are HMACs so plaintext
+# passwords never sit in memory. Failures are never cached: a fast failure
+# would reveal that the same guess was tried recently, and on login it would
+# make known and unknown emails (checked against a dummy hash) diverge.
+_verify_ok_cache: TTLCache[bytes, bool] = TTLCache(maxsize=4096, ttl=60)
+_verify_cache_lock = threading.Lock()
+
+# Decoded JWT payloads keyed by a digest of the raw token
+_token_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=60)
+_token_cache_lock = threading.Lock()
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    """Hash a password using the preferred scheme (Argon2id)."""
+    return _password_hasher.hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash uses a deprecated scheme or outdated parameters."""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    return _password_hasher.check_needs_rehash(hashed_password)
+
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against an Argon2 or legacy bcrypt hash."""
+    try:
+        if hashed_password.startswith(_BCRYPT_PREFIXES):
+            # bcrypt only looks at the first 72 bytes
+            return bcrypt.checkpw(plain_password.encode()[:72], hashed_password.encode())
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (InvalidHashError, VerificationError, ValueError):
+        return False
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a password against its hash, reusing recent successes."""
+    key = hmac.new(
+        _SECRET_KEY_BYTES,
+        f"{plain_password}|{hashed_password}".encode(),
+        hashlib.sha256,
+    ).digest()
+
+    with _verify_cache_lock:
+        if key in _verify_ok_cache:
+            return True
+
+    result = _check_password(plain_password, hashed_password)
+
+    if result:
+        with _verify_cache_lock:
+            _verify_ok_cache[key] = True
+
+    return result
+
+
+def _get_hash_limiter() -> anyio.CapacityLimiter:
+    """Get the capacity limiter for password hashing threads."""
+    global _hash_limiter
+    if _hash_limiter is None:
+        workers = settings.password_hash_workers or max(2, os.cpu_count() or 1)
+        _hash_limiter = anyio.CapacityLimiter(workers)
+    return _hash_limiter
+
+
+async def ahash_password(password: str) -> str:
+    """Hash a password in a worker thread."""
+    return await anyio.to_thread.run_sync(hash_password, password, limiter=_get_hash_limiter())
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread."""
+    return await anyio.to_thread.run_sync(
+        verify_password, plain_password, hashed_password, limiter=_get_hash_limiter()
+    )
+
+
+async def warm_up_password_hashing() -> None:
+    """Start a worker thread and load the hashing backend."""
+    await ahash_password("warm-up")
 
 
 def create_access_token(
@@ -42,7 +135,7 @@ def create_access_token(
     if extra_data:
         to_encode.update(extra_data)
 
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(to_encode, _SECRET_KEY_BYTES, algorithm=settings.jwt_algorithm)
 
 
 def create_refresh_token(
@@ -61,24 +154,48 @@ def create_refresh_token(
         "type": "refresh",
     }
 
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(to_encode, _SECRET_KEY_BYTES, algorithm=settings.jwt_algorithm)
 
 
 def verify_token(token: str, token_type: str = "access") -> dict[str, Any] | None:
     """Verify a JWT token and return its payload."""
-    try:
-        payload = jwt.decode(
-            token,
-            settings.secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
-
-        # Verify token type
-        if payload.get("type") != token_type:
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+
+    if payload is None or payload["exp"] <= now:
+        try:
+            payload = jwt.decode(
+                token,
+                _SECRET_KEY_BYTES,
+                algorithms=[settings.jwt_algorithm],
+            )
+        except InvalidTokenError:
             return None
 
-        return payload
-    except JWTError:
+        # Skip caching tokens that are about to expire
+        if payload.get("exp", 0) - now > 5:
+            with _token_cache_lock:
+                _token_cache[key] = payload
+
+    # Verify token type
+    if payload.get("type") != token_type:
+        return None
+
+    # Hand out a copy so callers cannot alter the cached payload
+    return dict(payload)
+
+
+def get_token_subject(payload: dict[str, Any]) -> uuid.UUID | None:
+    """Get the user ID from a token payload, or None if missing or malformed."""
+    subject = payload.get("sub")
+    if subject is None:
+        return None
+    try:
+        return uuid.UUID(subject)
+    except (TypeError, ValueError):
         return None
 
 
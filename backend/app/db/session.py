@@ -1,9 +1,17 @@
 """Database session and engine configuration."""
 
+import json
 import logging
+import re
 from pathlib import Path
+from collections.abc import Callable
+from typing import Any
 
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.config import settings
 
@@ -14,13 +22,82 @@ database_url = settings.database_url
 if database_url.startswith("sqlite:///"):
     database_url = database_url.replace("sqlite:///", "sqlite+aiosqlite:///")
 
+is_sqlite = database_url.startswith("sqlite")
+
+# Pool configuration depends on the backend
+engine_options: dict[str, Any] = {}
+if is_sqlite:
+    engine_options["connect_args"] = {"check_same_thread": False}
+    # An in-memory database only exists on its connection, so share one.
+    # File databases keep the default pool so sessions get their own connection.
+    if ":memory:" in database_url:
+        engine_options["poolclass"] = StaticPool
+else:
+    engine_options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    if database_url.startswith("postgresql+asyncpg"):
+        # Keep repeated statements prepared per connection so hot lookups
+        # (login, token refresh) skip parse/plan on the server
+        engine_options["connect_args"] = {
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        }
+
+# orjson handles 64-bit integers only. A run of 20+ digits may be a wider
+# integer, which orjson would reject on dump and round to a float on load.
+_LONG_DIGITS_RE = re.compile(r"\d{20}")
+
+
+def json_serializer(value: Any) -> str:
+    """Serialize a JSON column value, falling back to json for wide integers."""
+    try:
+        return orjson.dumps(value).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(value)
+
+
+def json_deserializer(value: str) -> Any:
+    """Deserialize a JSON column value without losing wide integers."""
+    if _LONG_DIGITS_RE.search(value):
+        return json.loads(value)
+    return orjson.loads(value)
+
+
 # Create async engine
 engine = create_async_engine(
     database_url,
     echo=settings.debug,
     future=True,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+    **engine_options,
+)
+
+# SQLite connection tuning applied to every new DBAPI connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA foreign_keys=ON",
 )
 
+if is_sqlite:
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        """Enable WAL and related performance settings on new connections."""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -30,6 +107,33 @@ async_session_maker = async_sessionmaker(
     autoflush=False,
 )
 
+# Session.info key holding callbacks queued by on_commit
+_ON_COMMIT_KEY = "on_commit"
+
+
+def on_commit(session: AsyncSession, callback: Callable[[], object]) -> None:
+    """
+    Run ``callback`` once the session's current transaction commits.
+
+    Use this to drop in-process caches, so a concurrent read cannot
+    repopulate them from rows that are not committed yet. Callbacks are
+    discarded if the transaction rolls back.
+    """
+    session.info.setdefault(_ON_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit(session: Session) -> None:
+    """Run the callbacks queued for the transaction that just committed."""
+    for callback in session.info.pop(_ON_COMMIT_KEY, ()):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_commit(session: Session) -> None:
+    """Drop callbacks queued for a transaction that rolled back."""
+    session.info.pop(_ON_COMMIT_KEY, None)
+
 
 async def init_db() -> None:
     """Initialize the database, creating all tables."""
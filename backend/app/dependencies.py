@@ -2,11 +2,12 @@
 
 from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import verify_token
+from app.core.exceptions import UnauthorizedError
+from app.core.security import get_token_subject, verify_token
 from app.db.session import async_session_maker
 from app.models.user import User
 
@@ -15,59 +16,51 @@ security = HTTPBearer(auto_error=False)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session dependency."""
-    async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+    """Get a database session wrapped in one transaction per request.
+
+    The transaction commits when the handler returns and rolls back if it
+    raises, so services only need to flush. Use it through ``DbSession`` so
+    the dependency is function-scoped and the commit lands before the
+    response is sent.
+    """
+    async with async_session_maker() as session, session.begin():
+        yield session
+
+
+# Function scope ends the session before the response goes out, so clients
+# never observe a response for a write that has not committed yet
+DbSession = Annotated[AsyncSession, Depends(get_db, scope="function")]
 
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: DbSession,
 ) -> User:
     """Get current authenticated user from JWT token."""
     if credentials is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise UnauthorizedError("Not authenticated")
 
     token = credentials.credentials
     payload = verify_token(token)
 
     if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise UnauthorizedError("Invalid or expired token")
 
-    user_id = payload.get("sub")
+    user_id = get_token_subject(payload)
     if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise UnauthorizedError("Invalid token payload")
 
     # Get user from database
     user = await db.get(User, user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise UnauthorizedError("User not found")
 
     return user
 
 
 async def get_current_user_optional(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: DbSession,
 ) -> User | None:
     """Get current user if authenticated, otherwise return None."""
     if credentials is None:
@@ -80,6 +73,5 @@ async def get_current_user_optional(
 
 
 # Type aliases for cleaner dependency injection
-DbSession = Annotated[AsyncSession, Depends(get_db)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 OptionalUser = Annotated[User | None, Depends(get_current_user_optional)]
@@ -6,9 +6,11 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.router import api_router
 from app.config import settings
+from app.core.security import warm_up_password_hashing
 from app.db.session import init_db
 
 # Configure logging
@@ -34,6 +36,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings.backup_dir.mkdir(parents=True, exist_ok=True)
     logger.info("Storage directories verified")
 
+    # Load the password hashing backend before the first login arrives
+    await warm_up_password_hashing()
+    logger.info("Password hashing ready")
+
     yield
 
     # Shutdown
@@ -61,6 +67,9 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress larger responses such as document listings
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Include API router
     app.include_router(api_router, prefix="/api")
 
@@ -1,11 +1,13 @@
 """Attachment model for document files."""
 
-from typing import TYPE_CHECKING
+import uuid
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Integer, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.types import JSONType
 
 if TYPE_CHECKING:
     from app.models.document import Document
@@ -15,9 +17,10 @@ class Attachment(Base, UUIDMixin, TimestampMixin):
     """File attachment associated with a document."""
 
     __tablename__ = "attachments"
+    _repr_attrs = ("filename",)
 
-    document_id: Mapped[str] = mapped_column(
-        String(36),
+    document_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -48,10 +51,10 @@ class Attachment(Base, UUIDMixin, TimestampMixin):
         nullable=True,
     )
 
-    ocr_data_json: Mapped[str | None] = mapped_column(
-        Text,
+    ocr_data_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONType,
         nullable=True,
-        default="{}",
+        default=dict,
     )
 
     # Relationship
@@ -59,6 +62,3 @@ class Attachment(Base, UUIDMixin, TimestampMixin):
         "Document",
         back_populates="attachments",
     )
-
-    def __repr__(self) -> str:
-        return f"<Attachment {self.filename}>"
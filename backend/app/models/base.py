@@ -1,24 +1,72 @@
-"""SQLAlchemy base model and mixins."""
+"""SQLAlchemy base model and mixins.
 
+All datetimes are stored as naive UTC; response schemas mark them as UTC
+on the way out.
+"""
+
+import reprlib
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, ClassVar
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Uuid
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 
 
-def generate_uuid() -> str:
-    """Generate a new UUID string."""
-    return str(uuid.uuid4())
+def utc_now() -> datetime:
+    """Get current UTC datetime as a naive value for storage."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
-def utc_now() -> datetime:
-    """Get current UTC datetime."""
-    return datetime.now(timezone.utc)
+class UTCNow(FunctionElement[datetime]):
+    """Database-side current UTC timestamp (naive, matching utc_now())."""
+
+    type = DateTime(timezone=False)
+    inherit_cache = True
+
+
+@compiles(UTCNow, "postgresql")
+def _compile_utcnow_postgresql(element: UTCNow, compiler: SQLCompiler, **kw: Any) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(UTCNow, "sqlite")
+def _compile_utcnow_sqlite(element: UTCNow, compiler: SQLCompiler, **kw: Any) -> str:
+    # CURRENT_TIMESTAMP only has whole seconds; this keeps SQLite's milliseconds
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+@compiles(UTCNow)
+def _compile_utcnow(element: UTCNow, compiler: SQLCompiler, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"
 
 
-class Base(DeclarativeBase):
+_repr = reprlib.Repr()
+_repr.maxstring = 50
+_repr.maxother = 50
+
+
+class ReprMixin:
+    """Shared __repr__ built from the attributes named in _repr_attrs.
+
+    Values are read from the instance __dict__, so an expired or unloaded
+    attribute shows as None instead of emitting SQL.
+    """
+
+    _repr_attrs: ClassVar[tuple[str, ...]] = ("id",)
+
+    @reprlib.recursive_repr()
+    def __repr__(self) -> str:
+        fields = " ".join(
+            f"{name}={_repr.repr(self.__dict__.get(name))}" for name in self._repr_attrs
+        )
+        return f"<{type(self).__name__} {fields}>"
+
+
+class Base(ReprMixin, DeclarativeBase):
     """Base class for all database models."""
 
     @declared_attr.directive
@@ -36,20 +84,25 @@ class Base(DeclarativeBase):
 
 
 class TimestampMixin:
-    """Mixin that adds created_at and updated_at timestamps."""
+    """Mixin that adds created_at and updated_at timestamps.
+
+    Both are set by the database (on INSERT, and in the UPDATE itself for
+    updated_at) so they share one clock and one precision; eager defaults
+    fetch them back via RETURNING so they never need a lazy load.
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        server_default=func.now(),
+        DateTime(timezone=False),
+        server_default=UTCNow(),
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=utc_now,
-        server_default=func.now(),
-        onupdate=utc_now,
+        DateTime(timezone=False),
+        server_default=UTCNow(),
+        onupdate=UTCNow(),
         nullable=False,
     )
 
@@ -57,9 +110,9 @@ class TimestampMixin:
 class UUIDMixin:
     """Mixin that adds a UUID primary key."""
 
-    id: Mapped[str] = mapped_column(
-        String(36),
+    id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         primary_key=True,
-        default=generate_uuid,
+        default=uuid.uuid4,
         nullable=False,
     )
@@ -1,11 +1,13 @@
 """Collection and DocumentCollection models."""
 
-from typing import TYPE_CHECKING
+import uuid
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import ForeignKey, Integer, String, Text, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.types import JSONType
 
 if TYPE_CHECKING:
     from app.models.document import Document
@@ -16,19 +18,20 @@ class Collection(Base, UUIDMixin, TimestampMixin):
     """Collection/folder model for organizing documents."""
 
     __tablename__ = "collections"
+    _repr_attrs = ("name",)
     __table_args__ = (
         UniqueConstraint("user_id", "name", "parent_id", name="uq_user_collection_name"),
     )
 
-    user_id: Mapped[str] = mapped_column(
-        String(36),
+    # user_id lookups are served by the unique constraint's index
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    parent_id: Mapped[str | None] = mapped_column(
-        String(36),
+    parent_id: Mapped[uuid.UUID | None] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("collections.id", ondelete="CASCADE"),
         nullable=True,
         index=True,
@@ -37,7 +40,6 @@ class Collection(Base, UUIDMixin, TimestampMixin):
     name: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
-        index=True,
     )
 
     icon: Mapped[str] = mapped_column(
@@ -51,10 +53,10 @@ class Collection(Base, UUIDMixin, TimestampMixin):
         nullable=True,
     )
 
-    settings_json: Mapped[str | None] = mapped_column(
-        Text,
+    settings_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONType,
         nullable=True,
-        default="{}",
+        default=dict,
     )
 
     # Relationships
@@ -73,36 +75,36 @@ class Collection(Base, UUIDMixin, TimestampMixin):
         "Collection",
         back_populates="parent",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     document_collections: Mapped[list["DocumentCollection"]] = relationship(
         "DocumentCollection",
         back_populates="collection",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
-    def __repr__(self) -> str:
-        return f"<Collection {self.name}>"
-
 
 class DocumentCollection(Base):
     """Association table for Document-Collection many-to-many relationship."""
 
     __tablename__ = "document_collections"
+    _repr_attrs = ("document_id", "collection_id")
     __table_args__ = (
         UniqueConstraint("document_id", "collection_id", name="uq_document_collection"),
     )
 
-    document_id: Mapped[str] = mapped_column(
-        String(36),
+    document_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         primary_key=True,
     )
 
-    collection_id: Mapped[str] = mapped_column(
-        String(36),
+    collection_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("collections.id", ondelete="CASCADE"),
         primary_key=True,
     )
@@ -123,6 +125,3 @@ class DocumentCollection(Base):
         "Collection",
         back_populates="document_collections",
     )
-
-    def __repr__(self) -> str:
-        return f"<DocumentCollection {self.document_id}:{self.collection_id}>"
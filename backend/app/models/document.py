@@ -1,20 +1,30 @@
 """Document and DocumentChunk models."""
 
+import hashlib
+import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from sqlalchemy import (
+    DDL,
     Boolean,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
+    Uuid,
+    event,
+    text,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.models.base import Base, TimestampMixin, UUIDMixin, utc_now
+from app.models.types import Float32Vector, JSONType, TextArray
 
 if TYPE_CHECKING:
     from app.models.attachment import Attachment
@@ -24,24 +34,79 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 
+def compute_content_hash(content: str) -> bytes:
+    """Hash chunk text for embedding reuse (128-bit BLAKE2b)."""
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+def compute_url_hash(url: str) -> bytes:
+    """Hash a source URL for duplicate lookups (128-bit BLAKE2b)."""
+    return hashlib.blake2b(url.encode(), digest_size=16).digest()
+
+
 class Document(Base, UUIDMixin, TimestampMixin):
     """Main document/note model."""
 
     __tablename__ = "documents"
+    _repr_attrs = ("title",)
+    __table_args__ = (
+        # Serve "this user's (non-)archived / pinned documents, newest first"
+        # straight from the index, without a separate sort
+        Index(
+            "ix_documents_user_archived_updated",
+            "user_id",
+            "is_archived",
+            text("updated_at DESC"),
+        ),
+        # Partial indexes over the small, frequently polled subsets
+        Index(
+            "ix_documents_pinned",
+            "user_id",
+            "updated_at",
+            postgresql_where=text("is_pinned = true"),
+            sqlite_where=text("is_pinned = 1"),
+        ),
+        Index(
+            "ix_documents_pending",
+            "user_id",
+            "created_at",
+            postgresql_where=text("is_processed = false"),
+            sqlite_where=text("is_processed = 0"),
+        ),
+        # "Do I already have this URL?" without comparing full URLs
+        Index("ix_documents_user_source_url_hash", "user_id", "source_url_hash"),
+        # Tag filters: WHERE tag_names && ARRAY[...]
+        Index(
+            "ix_documents_tag_names_gin",
+            "tag_names",
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        # Substring/similarity search on PostgreSQL (pg_trgm, see below)
+        Index(
+            "ix_documents_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_documents_content_plain_trgm",
+            "content_plain",
+            postgresql_using="gin",
+            postgresql_ops={"content_plain": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
-    # Foreign keys
-    user_id: Mapped[str] = mapped_column(
-        String(36),
+    # Foreign keys (user_id lookups are served by the composite indexes)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     # Content
     title: Mapped[str] = mapped_column(
         String(500),
         nullable=False,
-        index=True,
     )
 
     content_raw: Mapped[str | None] = mapped_column(
@@ -74,19 +139,35 @@ class Document(Base, UUIDMixin, TimestampMixin):
     )  # manual, upload, import, api
 
     source_url: Mapped[str | None] = mapped_column(
-        String(2048),
+        Text,
         nullable=True,
     )
 
-    metadata_json: Mapped[str | None] = mapped_column(
-        Text,  # Store as JSON string
+    # Hash of source_url, kept in sync by the validator below. Core bulk
+    # inserts bypass validators and must set it via compute_url_hash().
+    source_url_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(16),
         nullable=True,
-        default="{}",
     )
 
-    # Vector embedding (stored as JSON array of floats)
-    embedding: Mapped[str | None] = mapped_column(
-        Text,
+    metadata_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONType,
+        nullable=True,
+        default=dict,
+    )
+
+    # Denormalized copy of the attached tag names so tag filters skip the
+    # document_tags/tags join. Kept in sync by triggers on PostgreSQL (see
+    # app.models.tag); other backends must maintain it from application code.
+    tag_names: Mapped[list[str]] = mapped_column(
+        TextArray,
+        nullable=False,
+        default=list,
+    )
+
+    # Vector embedding (packed float32)
+    embedding: Mapped[np.ndarray | None] = mapped_column(
+        Float32Vector,
         nullable=True,
     )
 
@@ -99,12 +180,12 @@ class Document(Base, UUIDMixin, TimestampMixin):
 
     # Dates
     source_date: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True),
+        DateTime(timezone=False),
         nullable=True,
     )
 
     last_accessed: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        DateTime(timezone=False),
         default=utc_now,
         nullable=False,
     )
@@ -114,21 +195,18 @@ class Document(Base, UUIDMixin, TimestampMixin):
         Boolean,
         default=False,
         nullable=False,
-        index=True,
     )
 
     is_pinned: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
         nullable=False,
-        index=True,
     )
 
     is_processed: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
         nullable=False,
-        index=True,
     )
 
     # Relationships
@@ -141,14 +219,16 @@ class Document(Base, UUIDMixin, TimestampMixin):
         "DocumentChunk",
         back_populates="document",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     document_tags: Mapped[list["DocumentTag"]] = relationship(
         "DocumentTag",
         back_populates="document",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     outgoing_links: Mapped[list["DocumentLink"]] = relationship(
@@ -156,7 +236,8 @@ class Document(Base, UUIDMixin, TimestampMixin):
         back_populates="source",
         foreign_keys="DocumentLink.source_id",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     incoming_links: Mapped[list["DocumentLink"]] = relationship(
@@ -164,34 +245,75 @@ class Document(Base, UUIDMixin, TimestampMixin):
         back_populates="target",
         foreign_keys="DocumentLink.target_id",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     document_collections: Mapped[list["DocumentCollection"]] = relationship(
         "DocumentCollection",
         back_populates="document",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     attachments: Mapped[list["Attachment"]] = relationship(
         "Attachment",
         back_populates="document",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
+
+    @validates("source_url")
+    def _update_source_url_hash(self, key: str, value: str | None) -> str | None:
+        self.source_url_hash = compute_url_hash(value) if value else None
+        return value
+
+
+# PostgreSQL keyword search: a weighted tsvector over title and body,
+# generated by the database and GIN-indexed. It is deliberately not mapped
+# (SQLite has no equivalent); query it as
+#   literal_column("documents.search_vector").op("@@")(
+#       func.plainto_tsquery("english", q))
+_SEARCH_VECTOR_DDL = (
+    """
+    ALTER TABLE documents ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(content_plain, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_documents_search_vector ON documents USING gin (search_vector)",
+)
+
+for _statement in _SEARCH_VECTOR_DDL:
+    event.listen(
+        Document.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
     )
 
-    def __repr__(self) -> str:
-        return f"<Document {self.title[:50]}>"
+# The trigram indexes need pg_trgm before any table is created
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
 
 
 class DocumentChunk(Base, UUIDMixin):
     """Document chunk for granular embeddings."""
 
     __tablename__ = "document_chunks"
+    _repr_attrs = ("document_id", "chunk_index")
+    __table_args__ = (
+        # Look up an existing embedding for identical text from the same model
+        Index("ix_document_chunks_model_hash", "embedding_model", "content_hash"),
+    )
 
-    document_id: Mapped[str] = mapped_column(
-        String(36),
+    document_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -207,16 +329,30 @@ class DocumentChunk(Base, UUIDMixin):
         nullable=False,
     )
 
-    # Vector embedding (stored as JSON array)
-    embedding: Mapped[str | None] = mapped_column(
-        Text,
+    # Hash of content, kept in sync by the validator below. Core bulk
+    # inserts bypass validators and must set it via compute_content_hash().
+    content_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(16),
+        nullable=False,
+    )
+
+    # Vector embedding (packed float32)
+    embedding: Mapped[np.ndarray | None] = mapped_column(
+        Float32Vector,
         nullable=True,
     )
 
-    metadata_json: Mapped[str | None] = mapped_column(
-        Text,
+    # Model that produced the embedding; part of the reuse key so a model
+    # upgrade never serves vectors from the old one
+    embedding_model: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+
+    metadata_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONType,
         nullable=True,
-        default="{}",
+        default=dict,
     )
 
     # Relationship
@@ -225,5 +361,7 @@ class DocumentChunk(Base, UUIDMixin):
         back_populates="chunks",
     )
 
-    def __repr__(self) -> str:
-        return f"<DocumentChunk {self.document_id}:{self.chunk_index}>"
+    @validates("content")
+    def _update_content_hash(self, key: str, value: str) -> str:
+        self.content_hash = compute_content_hash(value)
+        return value
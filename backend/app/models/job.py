@@ -1,12 +1,14 @@
 """Job and history tracking models."""
 
+import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.types import JSONType
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -16,9 +18,10 @@ class IngestionJob(Base, UUIDMixin, TimestampMixin):
     """Background job for document ingestion."""
 
     __tablename__ = "ingestion_jobs"
+    _repr_attrs = ("id", "status")
 
-    user_id: Mapped[str] = mapped_column(
-        String(36),
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -37,13 +40,13 @@ class IngestionJob(Base, UUIDMixin, TimestampMixin):
         index=True,
     )  # pending, processing, completed, failed, cancelled
 
-    input_data_json: Mapped[str | None] = mapped_column(
-        Text,
+    input_data_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONType,
         nullable=True,
     )
 
-    result_data_json: Mapped[str | None] = mapped_column(
-        Text,
+    result_data_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONType,
         nullable=True,
     )
 
@@ -53,12 +56,12 @@ class IngestionJob(Base, UUIDMixin, TimestampMixin):
     )
 
     started_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True),
+        DateTime(timezone=False),
         nullable=True,
     )
 
     completed_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True),
+        DateTime(timezone=False),
         nullable=True,
     )
 
@@ -68,20 +71,19 @@ class IngestionJob(Base, UUIDMixin, TimestampMixin):
         back_populates="ingestion_jobs",
     )
 
-    def __repr__(self) -> str:
-        return f"<IngestionJob {self.id} ({self.status})>"
-
 
 class SearchHistory(Base, UUIDMixin):
     """Search history tracking."""
 
     __tablename__ = "search_history"
+    _repr_attrs = ("query",)
+    __table_args__ = (Index("ix_search_history_user_created", "user_id", text("created_at DESC")),)
 
-    user_id: Mapped[str] = mapped_column(
-        String(36),
+    # user_id lookups are served by the composite index above
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     query: Mapped[str] = mapped_column(
@@ -95,8 +97,8 @@ class SearchHistory(Base, UUIDMixin):
         default="hybrid",
     )  # hybrid, semantic, keyword
 
-    filters_json: Mapped[str | None] = mapped_column(
-        Text,
+    filters_json: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONType,
         nullable=True,
     )
 
@@ -107,7 +109,7 @@ class SearchHistory(Base, UUIDMixin):
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        DateTime(timezone=False),
         nullable=False,
     )
 
@@ -116,6 +118,3 @@ class SearchHistory(Base, UUIDMixin):
         "User",
         back_populates="search_history",
     )
-
-    def __repr__(self) -> str:
-        return f"<SearchHistory {self.query[:30]}>"
@@ -1,8 +1,9 @@
 """DocumentLink model for knowledge graph edges."""
 
+import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Float, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, Float, ForeignKey, Index, String, Text, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -15,22 +16,24 @@ class DocumentLink(Base, UUIDMixin, TimestampMixin):
     """Link between two documents (knowledge graph edge)."""
 
     __tablename__ = "document_links"
+    _repr_attrs = ("source_id", "target_id", "link_type")
     __table_args__ = (
         UniqueConstraint(
             "source_id", "target_id", "link_type",
             name="uq_document_link"
         ),
+        Index("ix_document_links_source_type", "source_id", "link_type"),
     )
 
-    source_id: Mapped[str] = mapped_column(
-        String(36),
+    # source_id lookups are served by the composite index above
+    source_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    target_id: Mapped[str] = mapped_column(
-        String(36),
+    target_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -70,6 +73,3 @@ class DocumentLink(Base, UUIDMixin, TimestampMixin):
         back_populates="incoming_links",
         foreign_keys=[target_id],
     )
-
-    def __repr__(self) -> str:
-        return f"<DocumentLink {self.source_id} -> {self.target_id} ({self.link_type})>"
@@ -1,8 +1,19 @@
 """Tag and DocumentTag models."""
 
+import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Float, ForeignKey, String, UniqueConstraint
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+    Uuid,
+    event,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -16,27 +27,27 @@ class Tag(Base, UUIDMixin, TimestampMixin):
     """Tag model for categorizing documents."""
 
     __tablename__ = "tags"
+    _repr_attrs = ("name",)
     __table_args__ = (
         UniqueConstraint("user_id", "name", name="uq_user_tag_name"),
     )
 
-    user_id: Mapped[str] = mapped_column(
-        String(36),
+    # user_id lookups are served by the unique constraint's index
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     name: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
-        index=True,
     )
 
-    color: Mapped[str] = mapped_column(
-        String(7),  # Hex color code
+    color: Mapped[int] = mapped_column(
+        Integer,  # Packed 0xRRGGBB; schemas expose it as "#rrggbb"
         nullable=False,
-        default="#6366f1",  # Default indigo
+        default=0x6366F1,  # Default indigo
     )
 
     is_auto: Mapped[bool] = mapped_column(
@@ -55,29 +66,28 @@ class Tag(Base, UUIDMixin, TimestampMixin):
         "DocumentTag",
         back_populates="tag",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
-    def __repr__(self) -> str:
-        return f"<Tag {self.name}>"
-
 
 class DocumentTag(Base):
     """Association table for Document-Tag many-to-many relationship."""
 
     __tablename__ = "document_tags"
+    _repr_attrs = ("document_id", "tag_id")
     __table_args__ = (
         UniqueConstraint("document_id", "tag_id", name="uq_document_tag"),
     )
 
-    document_id: Mapped[str] = mapped_column(
-        String(36),
+    document_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         primary_key=True,
     )
 
-    tag_id: Mapped[str] = mapped_column(
-        String(36),
+    tag_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid(as_uuid=True),
         ForeignKey("tags.id", ondelete="CASCADE"),
         primary_key=True,
     )
@@ -105,5 +115,58 @@ class DocumentTag(Base):
         back_populates="document_tags",
     )
 
-    def __repr__(self) -> str:
-        return f"<DocumentTag {self.document_id}:{self.tag_id}>"
+
+# PostgreSQL triggers keeping Document.tag_names in sync with document_tags
+# and tag renames. Each statement is its own DDL so asyncpg can prepare it.
+_TAG_NAMES_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION sync_document_tag_names() RETURNS trigger AS $$
+    DECLARE
+        doc_id uuid;
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            doc_id := OLD.document_id;
+        ELSE
+            doc_id := NEW.document_id;
+        END IF;
+        UPDATE documents SET tag_names = COALESCE(
+            (SELECT array_agg(t.name ORDER BY t.name)
+             FROM document_tags dt JOIN tags t ON t.id = dt.tag_id
+             WHERE dt.document_id = doc_id),
+            '{}'
+        )
+        WHERE id = doc_id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER trg_document_tags_sync_names
+    AFTER INSERT OR DELETE ON document_tags
+    FOR EACH ROW EXECUTE FUNCTION sync_document_tag_names()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION rename_document_tag_names() RETURNS trigger AS $$
+    BEGIN
+        UPDATE documents d
+        SET tag_names = array_replace(d.tag_names, OLD.name, NEW.name)
+        FROM document_tags dt
+        WHERE dt.tag_id = NEW.id AND dt.document_id = d.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER trg_tags_rename_names
+    AFTER UPDATE OF name ON tags
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION rename_document_tag_names()
+    """,
+)
+
+for _statement in _TAG_NAMES_DDL:
+    event.listen(
+        DocumentTag.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
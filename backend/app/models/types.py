@@ -0,0 +1,42 @@
+"""Custom column types shared across models."""
+
+from typing import Any
+
+import numpy as np
+from sqlalchemy import JSON, LargeBinary, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+# JSON document column: JSONB on PostgreSQL, the generic JSON type elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# List of strings: native text[] on PostgreSQL, a JSON array elsewhere
+TextArray = JSON().with_variant(ARRAY(Text), "postgresql")
+
+
+class Float32Vector(TypeDecorator[np.ndarray]):
+    """Embedding vector stored as packed little-endian float32 bytes.
+
+    Accepts any sequence of floats on write and returns a read-only
+    numpy array that views the fetched bytes directly on read.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> bytes | None:
+        if value is None:
+            return None
+        return np.asarray(value, dtype="<f4").tobytes()
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> np.ndarray | None:
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype="<f4")
+
+    def compare_values(self, x: Any, y: Any) -> bool:
+        # The default == compares element-wise and fails on a length change
+        if x is None or y is None:
+            return x is y
+        return bool(np.array_equal(x, y))
@@ -1,11 +1,12 @@
 """User model."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Boolean, String, Text
+from sqlalchemy import Boolean, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.types import JSONType
 
 if TYPE_CHECKING:
     from app.models.collection import Collection
@@ -18,12 +19,21 @@ class User(Base, UUIDMixin, TimestampMixin):
     """User account model."""
 
     __tablename__ = "users"
+    _repr_attrs = ("username",)
+    __table_args__ = (
+        # The one index on email: enforces uniqueness everywhere and, on
+        # PostgreSQL, covers the columns login reads for an index-only scan
+        Index(
+            "ix_users_email",
+            "email",
+            unique=True,
+            postgresql_include=["id", "password_hash", "is_active"],
+        ),
+    )
 
     email: Mapped[str] = mapped_column(
         String(255),
-        unique=True,
         nullable=False,
-        index=True,
     )
 
     username: Mapped[str] = mapped_column(
@@ -44,10 +54,10 @@ class User(Base, UUIDMixin, TimestampMixin):
         nullable=False,
     )
 
-    settings: Mapped[str | None] = mapped_column(
-        Text,  # Store as JSON string
+    settings: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONType,
         nullable=True,
-        default="{}",
+        default=dict,
     )
 
     # Relationships
@@ -55,36 +65,38 @@ class User(Base, UUIDMixin, TimestampMixin):
         "Document",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     tags: Mapped[list["Tag"]] = relationship(
         "Tag",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     collections: Mapped[list["Collection"]] = relationship(
         "Collection",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     ingestion_jobs: Mapped[list["IngestionJob"]] = relationship(
         "IngestionJob",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     search_history: Mapped[list["SearchHistory"]] = relationship(
         "SearchHistory",
         back_populates="user",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
-
-    def __repr__(self) -> str:
-        return f"<User {self.username}>"
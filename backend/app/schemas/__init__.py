@@ -1,6 +1,12 @@
 """Pydantic schemas package."""
 
-from app.schemas.common import Message, PaginatedResponse, PaginationParams
+from app.schemas.common import (
+    CursorParams,
+    CursorResponse,
+    Message,
+    PaginatedResponse,
+    PaginationParams,
+)
 from app.schemas.user import (
     Token,
     TokenPair,
@@ -11,6 +17,8 @@ from app.schemas.user import (
 )
 
 __all__ = [
+    "CursorParams",
+    "CursorResponse",
     "Message",
     "PaginatedResponse",
     "PaginationParams",
@@ -1,15 +1,64 @@
 """Common Pydantic schemas used across the application."""
 
-from typing import Any, Generic, TypeVar
-
-from pydantic import BaseModel, ConfigDict, Field
+import base64
+import re
+import uuid
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Annotated, Any, Generic, TypeVar
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    field_validator,
+)
 
 T = TypeVar("T")
 
 
+def _as_utc(value: datetime) -> datetime:
+    """Mark naive (stored) datetimes as UTC and normalize aware ones to UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+# Datetime field for responses; database values are naive UTC
+UTCDateTime = Annotated[datetime, AfterValidator(_as_utc)]
+
+
+# int(..., 16) alone would also take "0x", signs, whitespace and underscores
+_HEX_COLOR_RE = re.compile(r"#?[0-9a-fA-F]{6}")
+
+
+def _parse_hex_color(value: Any) -> Any:
+    """Accept "#rrggbb" strings as well as packed integers."""
+    if isinstance(value, str):
+        if not _HEX_COLOR_RE.fullmatch(value):
+            raise ValueError("Color must be in #rrggbb format")
+        return int(value.removeprefix("#"), 16)
+    return value
+
+
+# RGB color stored as a packed 0xRRGGBB integer, exchanged as "#rrggbb"
+HexColor = Annotated[
+    int,
+    BeforeValidator(_parse_hex_color),
+    Field(ge=0, le=0xFFFFFF),
+    PlainSerializer(lambda value: f"#{value:06x}", return_type=str),
+]
+
+
 class Message(BaseModel):
     """Simple message response."""
 
+    model_config = ConfigDict(frozen=True)
+
     message: str
 
 
@@ -27,10 +76,96 @@ class PaginationParams(BaseModel):
         return (self.page - 1) * self.limit
 
 
+def _as_naive_utc(value: datetime) -> datetime:
+    """Convert a datetime to naive UTC, the form the columns store."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def encode_cursor(sort_value: datetime, row_id: uuid.UUID) -> str:
+    """Encode a keyset position (sort timestamp, row id) as an opaque cursor."""
+    raw = f"{_as_naive_utc(sort_value).isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor. Raises ValueError if malformed.
+
+    The timestamp comes back as naive UTC so it compares directly with the
+    stored columns.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        sort_value, row_id = raw.split("|", 1)
+        return _as_naive_utc(datetime.fromisoformat(sort_value)), uuid.UUID(row_id)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+class CursorParams(BaseModel):
+    """
+    Keyset pagination parameters for user-facing lists.
+
+    Queries filter with ``tuple_(Model.updated_at, Model.id) < decode_cursor(c)``,
+    order by both columns descending and fetch ``limit + 1`` rows, so
+    deep pages cost the same as the first one.
+    """
+
+    cursor: str | None = Field(default=None, description="Cursor from the previous page")
+    limit: int = Field(default=20, ge=1, le=100, description="Items per page")
+
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, v: str | None) -> str | None:
+        """Reject malformed cursors while parsing, so they surface as a 422."""
+        if v:
+            decode_cursor(v)
+        return v
+
+    @cached_property
+    def position(self) -> tuple[datetime, uuid.UUID] | None:
+        """Decoded cursor position, or None for the first page."""
+        return decode_cursor(self.cursor) if self.cursor else None
+
+
+class CursorResponse(BaseModel, Generic[T]):
+    """Keyset-paginated response wrapper without a total count."""
+
+    model_config = ConfigDict(frozen=True)
+
+    items: list[T]
+    next_cursor: str | None
+    has_more: bool
+
+    @classmethod
+    def create(
+        cls,
+        rows: Sequence[T],
+        limit: int,
+        key: Callable[[T], tuple[datetime, uuid.UUID]],
+    ) -> "CursorResponse[T]":
+        """
+        Create a page from up to ``limit + 1`` rows fetched in cursor order.
+
+        Rows must already be item schema instances; the wrapper is built
+        without re-validation.
+        """
+        has_more = len(rows) > limit
+        items = list(rows[:limit])
+        next_cursor = encode_cursor(*key(items[-1])) if has_more else None
+        return cls.model_construct(
+            items=items,
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Generic paginated response wrapper."""
+    """Generic paginated response wrapper with a total count (admin views)."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(frozen=True)
 
     items: list[T]
     total: int
@@ -46,9 +181,14 @@ class PaginatedResponse(BaseModel, Generic[T]):
         page: int,
         limit: int,
     ) -> "PaginatedResponse[T]":
-        """Create a paginated response."""
+        """
+        Create a paginated response.
+
+        Items must already be item schema instances; the wrapper is built
+        without re-validation.
+        """
         pages = (total + limit - 1) // limit if limit > 0 else 0
-        return cls(
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
@@ -60,6 +200,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
 class ErrorResponse(BaseModel):
     """Error response schema."""
 
+    model_config = ConfigDict(frozen=True)
+
     detail: str
     error_code: str | None = None
     errors: list[dict[str, Any]] | None = None
@@ -68,6 +210,8 @@ class ErrorResponse(BaseModel):
 class SuccessResponse(BaseModel):
     """Generic success response."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool = True
     message: str | None = None
     data: dict[str, Any] | None = None
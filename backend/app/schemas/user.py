@@ -1,9 +1,40 @@
 """User-related Pydantic schemas."""
 
-from datetime import datetime
+import re
+import uuid
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
+from app.schemas.common import UTCDateTime
+
+# Letters, digits, underscores and hyphens, with at least one letter or digit.
+# [^\W_] is exactly the str.isalnum() class, so non-ASCII letters are allowed.
+_USERNAME_RE = re.compile(r"[\w-]*[^\W_][\w-]*")
+
+
+def _validate_username(v: str) -> str:
+    """Validate username characters and normalize to lowercase."""
+    if not _USERNAME_RE.fullmatch(v):
+        raise ValueError("Username can only contain letters, numbers, underscores, and hyphens")
+    return v.lower()
+
+
+def _validate_password_strength(v: str) -> str:
+    """Validate password strength in a single pass over the characters."""
+    has_upper = has_lower = has_digit = False
+    for c in v:
+        has_upper = has_upper or c.isupper()
+        has_lower = has_lower or c.islower()
+        has_digit = has_digit or c.isdigit()
+        if has_upper and has_lower and has_digit:
+            return v
+
+    if not has_upper:
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not has_lower:
+        raise ValueError("Password must contain at least one lowercase letter")
+    raise ValueError("Password must contain at least one digit")
+
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
@@ -21,23 +52,13 @@ class UserCreate(UserBase):
     @classmethod
     def validate_username(cls, v: str) -> str:
         """Validate username contains only allowed characters."""
-        if not v.replace("_", "").replace("-", "").isalnum():
-            raise ValueError(
-                "Username can only contain letters, numbers, underscores, and hyphens"
-            )
-        return v.lower()
+        return _validate_username(v)
 
     @field_validator("password")
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _validate_password_strength(v)
 
 
 class UserLogin(BaseModel):
@@ -59,24 +80,20 @@ class UserUpdate(BaseModel):
         """Validate username if provided."""
         if v is None:
             return v
-        if not v.replace("_", "").replace("-", "").isalnum():
-            raise ValueError(
-                "Username can only contain letters, numbers, underscores, and hyphens"
-            )
-        return v.lower()
+        return _validate_username(v)
 
 
 class UserResponse(BaseModel):
     """Schema for user response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    id: str
+    id: uuid.UUID
     email: str
     username: str
     is_active: bool
-    created_at: datetime
-    updated_at: datetime
+    created_at: UTCDateTime
+    updated_at: UTCDateTime
 
 
 class PasswordChange(BaseModel):
@@ -89,18 +106,14 @@ class PasswordChange(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate new password strength."""
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _validate_password_strength(v)
 
 
 class Token(BaseModel):
     """JWT token response."""
 
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     token_type: str = "bearer"
 
@@ -108,6 +121,8 @@ class Token(BaseModel):
 class TokenPair(BaseModel):
     """JWT token pair with refresh token."""
 
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
@@ -122,5 +137,7 @@ class TokenRefresh(BaseModel):
 class AuthResponse(BaseModel):
     """Full authentication response with user and tokens."""
 
+    model_config = ConfigDict(frozen=True)
+
     user: UserResponse
     tokens: TokenPair
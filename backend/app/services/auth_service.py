@@ -1,17 +1,28 @@
-"""Authentication service."""
+"""Authentication service.
+
+Operations are module-level functions that take the session explicitly,
+so request handlers do not build a service object per call. They flush
+but never commit; the request-scoped session (see app.dependencies.get_db)
+commits once when the request succeeds.
+"""
 
-import json
 import logging
-from datetime import datetime, timezone
+import secrets
+import uuid
+from types import MappingProxyType
 
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import exists, lambda_stmt, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import BadRequestError, ConflictError, UnauthorizedError
 from app.core.security import (
+    ahash_password,
+    averify_password,
     create_token_pair,
+    get_token_subject,
     hash_password,
-    verify_password,
+    password_needs_rehash,
     verify_token,
 )
 from app.models.user import User
@@ -19,119 +30,202 @@ from app.schemas.user import UserCreate, UserLogin, UserUpdate
 
 logger = logging.getLogger(__name__)
 
+# Settings for new accounts; copied per user so the column value is mutable
+_DEFAULT_SETTINGS = MappingProxyType({"theme": "system", "editor": "default"})
 
-class AuthService:
-    """Service for handling authentication operations."""
+# user_id -> is_active for the token refresh path. Short-lived so that an
+# account disabled outside this process stops refreshing within the TTL.
+_active_cache: TTLCache[uuid.UUID, bool] = TTLCache(maxsize=10_000, ttl=30)
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
+# Verified against when the email is unknown, so a failed login costs the
+# same whether or not the account exists
+_DUMMY_HASH = hash_password(secrets.token_urlsafe(32))
 
-    async def register(self, data: UserCreate) -> tuple[User, dict[str, str]]:
-        """Register a new user."""
-        # Check if email already exists
-        existing_email = await self.db.execute(
-            select(User).where(User.email == data.email)
-        )
-        if existing_email.scalar_one_or_none():
-            raise ConflictError("Email already registered")
 
-        # Check if username already exists
-        existing_username = await self.db.execute(
-            select(User).where(User.username == data.username)
-        )
-        if existing_username.scalar_one_or_none():
-            raise ConflictError("Username already taken")
+def invalidate_user_cache(user_id: uuid.UUID) -> None:
+    """Drop cached account state after a user changes."""
+    _active_cache.pop(user_id, None)
 
-        # Create new user
-        user = User(
-            email=data.email,
-            username=data.username,
-            password_hash=hash_password(data.password),
-            settings=json.dumps({"theme": "system", "editor": "default"}),
+
+async def register(db: AsyncSession, data: UserCreate) -> tuple[User, dict[str, str]]:
+    """Register a new user."""
+    # Check email and username in one round-trip; both are unique, so at
+    # most two rows can match. An email conflict is reported first.
+    email, username = data.email, data.username
+    result = await db.execute(
+        lambda_stmt(
+            lambda: select(User.email, User.username).where(
+                or_(User.email == email, User.username == username)
+            )
         )
+    )
+    conflicts = result.all()
+    if any(row.email == email for row in conflicts):
+        raise ConflictError("Email already registered")
+    if conflicts:
+        raise ConflictError("Username already taken")
+
+    # Create new user
+    user = User(
+        email=data.email,
+        username=data.username,
+        password_hash=await ahash_password(data.password),
+        settings=dict(_DEFAULT_SETTINGS),
+    )
+
+    db.add(user)
+    await db.flush()
+
+    # Generate tokens
+    tokens = create_token_pair(str(user.id))
+
+    logger.info(f"New user registered: {user.username}")
+    return user, tokens
+
+
+async def login(db: AsyncSession, data: UserLogin) -> tuple[User, dict[str, str]]:
+    """Authenticate a user and return tokens."""
+    # Find credentials by email; the full row is loaded only on success
+    email = data.email
+    result = await db.execute(
+        lambda_stmt(
+            lambda: select(User.id, User.password_hash, User.is_active).where(User.email == email)
+        )
+    )
+    credentials = result.one_or_none()
 
-        self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+    if credentials is None:
+        await averify_password(data.password, _DUMMY_HASH)
+        raise UnauthorizedError("Invalid email or password")
 
-        # Generate tokens
-        tokens = create_token_pair(user.id)
+    if not await averify_password(data.password, credentials.password_hash):
+        raise UnauthorizedError("Invalid email or password")
 
-        logger.info(f"New user registered: {user.username}")
-        return user, tokens
+    if not credentials.is_active:
+        raise UnauthorizedError("Account is disabled")
 
-    async def login(self, data: UserLogin) -> tuple[User, dict[str, str]]:
-        """Authenticate a user and return tokens."""
-        # Find user by email
-        result = await self.db.execute(
-            select(User).where(User.email == data.email)
-        )
-        user = result.scalar_one_or_none()
-
-        if user is None:
-            raise UnauthorizedError("Invalid email or password")
+    user = await db.get(User, credentials.id)
+    if user is None:
+        raise UnauthorizedError("Invalid email or password")
 
-        if not verify_password(data.password, user.password_hash):
-            raise UnauthorizedError("Invalid email or password")
+    # Upgrade legacy hashes now that we have the plaintext
+    if password_needs_rehash(credentials.password_hash):
+        user.password_hash = await ahash_password(data.password)
+        await db.flush()
 
-        if not user.is_active:
-            raise UnauthorizedError("Account is disabled")
+    # Generate tokens
+    tokens = create_token_pair(str(user.id))
 
-        # Generate tokens
-        tokens = create_token_pair(user.id)
+    logger.info(f"User logged in: {user.username}")
+    return user, tokens
 
-        logger.info(f"User logged in: {user.username}")
-        return user, tokens
 
-    async def refresh_tokens(self, refresh_token: str) -> dict[str, str]:
-        """Refresh access token using refresh token."""
-        payload = verify_token(refresh_token, token_type="refresh")
+async def refresh_tokens(db: AsyncSession, refresh_token: str) -> dict[str, str]:
+    """Refresh access token using refresh token."""
+    payload = verify_token(refresh_token, token_type="refresh")
 
-        if payload is None:
-            raise UnauthorizedError("Invalid or expired refresh token")
+    if payload is None:
+        raise UnauthorizedError("Invalid or expired refresh token")
 
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise UnauthorizedError("Invalid token payload")
+    user_id = get_token_subject(payload)
+    if user_id is None:
+        raise UnauthorizedError("Invalid token payload")
 
-        # Verify user still exists and is active
-        user = await self.db.get(User, user_id)
-        if user is None:
+    # Verify user still exists and is active; only the flag is needed
+    is_active = _active_cache.get(user_id)
+    if is_active is None:
+        is_active = await db.scalar(select(User.is_active).where(User.id == user_id))
+        if is_active is None:
             raise UnauthorizedError("User not found")
+        _active_cache[user_id] = is_active
 
-        if not user.is_active:
-            raise UnauthorizedError("Account is disabled")
+    if not is_active:
+        raise UnauthorizedError("Account is disabled")
 
-        # Generate new tokens
-        tokens = create_token_pair(user.id)
+    # Generate new tokens
+    tokens = create_token_pair(str(user_id))
 
-        logger.info(f"Tokens refreshed for user: {user.username}")
-        return tokens
+    logger.info(f"Tokens refreshed for user: {user_id}")
+    return tokens
 
-    async def update_user(self, user: User, data: UserUpdate) -> User:
-        """Update user profile."""
-        if data.username is not None:
-            # Check if new username is taken by another user
-            existing = await self.db.execute(
-                select(User).where(
-                    User.username == data.username,
+
+async def update_user(db: AsyncSession, user: User, data: UserUpdate) -> User:
+    """Update user profile."""
+    # Only keep values that differ from the current ones
+    new_username = data.username if data.username != user.username else None
+    new_settings = data.settings if data.settings != user.settings else None
+    if new_username is None and new_settings is None:
+        # Nothing to write; skip the conflict check and the UPDATE
+        return user
+
+    if new_username is not None:
+        # Check if new username is taken by another user
+        username_taken = await db.scalar(
+            select(
+                exists().where(
+                    User.username == new_username,
                     User.id != user.id,
                 )
             )
-            if existing.scalar_one_or_none():
-                raise ConflictError("Username already taken")
-            user.username = data.username
+        )
+        if username_taken:
+            raise ConflictError("Username already taken")
+        user.username = new_username
 
-        if data.settings is not None:
-            user.settings = json.dumps(data.settings)
+    if new_settings is not None:
+        user.settings = new_settings
 
-        user.updated_at = datetime.now(timezone.utc)
+    await db.flush()
+    invalidate_user_cache(user.id)
 
-        await self.db.commit()
-        await self.db.refresh(user)
+    logger.info(f"User updated: {user.username}")
+    return user
 
-        logger.info(f"User updated: {user.username}")
-        return user
+
+async def change_password(
+    db: AsyncSession,
+    user: User,
+    old_password: str,
+    new_password: str,
+) -> None:
+    """Change user password."""
+    if not await averify_password(old_password, user.password_hash):
+        raise BadRequestError("Current password is incorrect")
+
+    user.password_hash = await ahash_password(new_password)
+
+    await db.flush()
+    invalidate_user_cache(user.id)
+
+    logger.info(f"Password changed for user: {user.username}")
+
+
+async def get_user_by_id(db: AsyncSession, user_id: uuid.UUID) -> User | None:
+    """Get user by ID."""
+    return await db.get(User, user_id)
+
+
+class AuthService:
+    """Session-bound wrapper around the auth functions, kept for compatibility."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def register(self, data: UserCreate) -> tuple[User, dict[str, str]]:
+        """Register a new user."""
+        return await register(self.db, data)
+
+    async def login(self, data: UserLogin) -> tuple[User, dict[str, str]]:
+        """Authenticate a user and return tokens."""
+        return await login(self.db, data)
+
+    async def refresh_tokens(self, refresh_token: str) -> dict[str, str]:
+        """Refresh access token using refresh token."""
+        return await refresh_tokens(self.db, refresh_token)
+
+    async def update_user(self, user: User, data: UserUpdate) -> User:
+        """Update user profile."""
+        return await update_user(self.db, user, data)
 
     async def change_password(
         self,
@@ -140,16 +234,8 @@ class AuthService:
         new_password: str,
     ) -> None:
         """Change user password."""
-        if not verify_password(old_password, user.password_hash):
-            raise BadRequestError("Current password is incorrect")
-
-        user.password_hash = hash_password(new_password)
-        user.updated_at = datetime.now(timezone.utc)
-
-        await self.db.commit()
-
-        logger.info(f"Password changed for user: {user.username}")
+        await change_password(self.db, user, old_password, new_password)
 
-    async def get_user_by_id(self, user_id: str) -> User | None:
+    async def get_user_by_id(self, user_id: uuid.UUID) -> User | None:
         """Get user by ID."""
-        return await self.db.get(User, user_id)
+        return await get_user_by_id(self.db, user_id)
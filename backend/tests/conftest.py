@@ -6,12 +6,13 @@ from typing import AsyncGenerator, Generator
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from app.config import settings
-from app.db.session import async_session_maker
+from app.db.session import async_session_maker, json_deserializer, json_serializer
 from app.dependencies import get_db
 from app.main import app
 from app.models.base import Base
@@ -30,28 +31,26 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def test_db() -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
+async def test_session_maker() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Create a fresh test database and return a session factory bound to it."""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    TestSessionLocal = sessionmaker(
+    yield async_sessionmaker(
         engine,
         class_=AsyncSession,
         expire_on_commit=False,
-        autocommit=False,
         autoflush=False,
     )
 
-    async with TestSessionLocal() as session:
-        yield session
-
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
@@ -59,11 +58,24 @@ async def test_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def test_db(
+    test_session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session."""
+    async with test_session_maker() as session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(
+    test_session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncClient, None]:
     """Create a test client with overridden database dependency."""
 
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        yield test_db
+        # Mirror get_db: a new session and one transaction per request
+        async with test_session_maker() as session, session.begin():
+            yield session
 
     app.dependency_overrides[get_db] = override_get_db
 
@@ -72,3 +84,50 @@ async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+
+
+class QueryCounter:
+    """Counts SQL statements executed while attached to engines."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args: object) -> None:
+        self.count += 1
+
+
+@pytest.fixture
+def query_counter() -> Generator[QueryCounter, None, None]:
+    """Count SQL statements issued during a test, for ad-hoc assertions."""
+    counter = QueryCounter()
+    event.listen(Engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(Engine, "before_cursor_execute", counter)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, None, None]:
+    """
+    Enforce ``@pytest.mark.max_queries(n)``.
+
+    Statements are counted only while the test body runs (fixture setup is
+    excluded), and going over the limit fails the test itself, catching
+    N+1 regressions.
+    """
+    marker = item.get_closest_marker("max_queries")
+    if marker is None:
+        return (yield)
+
+    counter = QueryCounter()
+    event.listen(Engine, "before_cursor_execute", counter)
+    try:
+        result = yield
+    finally:
+        event.remove(Engine, "before_cursor_execute", counter)
+
+    limit = marker.args[0]
+    if counter.count > limit:
+        pytest.fail(f"Executed {counter.count} SQL statements, expected at most {limit}")
+    return result
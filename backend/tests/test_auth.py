@@ -0,0 +1,133 @@
+"""Authentication endpoint tests."""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import security
+from app.models.user import User
+
+REGISTER_URL = "/api/auth/register"
+LOGIN_URL = "/api/auth/login"
+ME_URL = "/api/auth/me"
+
+
+async def register_user(client: AsyncClient, email: str = "alice@example.com") -> None:
+    """Register a user with a known password."""
+    response = await client.post(
+        REGISTER_URL,
+        json={"email": email, "username": "alice", "password": "Correct-horse1"},
+    )
+    assert response.status_code == 201, response.text
+
+
+@pytest_asyncio.fixture
+async def registered_user(client: AsyncClient) -> None:
+    """Register the default user during fixture setup (outside query budgets)."""
+    await register_user(client)
+
+
+@pytest.mark.max_queries(2)
+async def test_login_query_budget(client: AsyncClient, registered_user: None) -> None:
+    """Login reads the credential columns, then the user row; nothing more."""
+    response = await client.post(
+        LOGIN_URL, json={"email": "alice@example.com", "password": "Correct-horse1"}
+    )
+    assert response.status_code == 200, response.text
+
+
+async def test_failed_login_verifies_hash_for_known_and_unknown_emails(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every failed login runs a full hash check, so timing does not leak accounts."""
+    await register_user(client)
+
+    calls: list[str] = []
+    check_password = security._check_password
+
+    def counting_check(plain_password: str, hashed_password: str) -> bool:
+        calls.append(hashed_password)
+        return check_password(plain_password, hashed_password)
+
+    monkeypatch.setattr(security, "_check_password", counting_check)
+
+    # Repeat each attempt so a cached result would show up as a missing check
+    for email in ("alice@example.com", "nobody@example.com", "other@example.com"):
+        for _ in range(2):
+            response = await client.post(
+                LOGIN_URL, json={"email": email, "password": "Wrong-password1"}
+            )
+            assert response.status_code == 401
+            assert response.json()["detail"] == "Invalid email or password"
+
+    assert len(calls) == 6
+
+
+async def test_update_keeps_updated_at_after_created_at(client: AsyncClient) -> None:
+    """A profile update in the same second as registration never moves time backwards."""
+    response = await client.post(
+        REGISTER_URL,
+        json={"email": "bob@example.com", "username": "bob", "password": "Correct-horse1"},
+    )
+    assert response.status_code == 201, response.text
+    token = response.json()["tokens"]["access_token"]
+
+    response = await client.patch(
+        ME_URL,
+        json={"username": "robert"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200, response.text
+
+    body = response.json()
+    created_at = datetime.fromisoformat(body["created_at"])
+    updated_at = datetime.fromisoformat(body["updated_at"])
+    assert updated_at >= created_at
+
+
+async def test_me_reflects_profile_update(client: AsyncClient) -> None:
+    """A cached /me response is replaced once a profile update commits."""
+    response = await client.post(
+        REGISTER_URL,
+        json={"email": "carol@example.com", "username": "carol", "password": "Correct-horse1"},
+    )
+    assert response.status_code == 201, response.text
+    headers = {"Authorization": f"Bearer {response.json()['tokens']['access_token']}"}
+
+    response = await client.get(ME_URL, headers=headers)
+    assert response.json()["username"] == "carol"
+
+    response = await client.patch(ME_URL, json={"username": "caroline"}, headers=headers)
+    assert response.status_code == 200, response.text
+
+    response = await client.get(ME_URL, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["username"] == "caroline"
+
+
+async def test_update_settings_keeps_wide_integers(
+    client: AsyncClient,
+    test_session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    """Settings integers wider than 64 bits are stored and read back exactly."""
+    response = await client.post(
+        REGISTER_URL,
+        json={"email": "dave@example.com", "username": "dave", "password": "Correct-horse1"},
+    )
+    assert response.status_code == 201, response.text
+    headers = {"Authorization": f"Bearer {response.json()['tokens']['access_token']}"}
+
+    wide = 10**30
+    response = await client.patch(ME_URL, json={"settings": {"n": wide}}, headers=headers)
+    assert response.status_code == 200, response.text
+
+    async with test_session_maker() as session:
+        settings = await session.scalar(
+            select(User.settings).where(User.email == "dave@example.com")
+        )
+    assert settings == {"n": wide}
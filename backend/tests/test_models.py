@@ -0,0 +1,25 @@
+"""ORM model and column type tests."""
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.document import Document
+from app.models.user import User
+
+
+async def test_embedding_can_change_dimension(test_db: AsyncSession) -> None:
+    """Replacing an embedding with one of another length flushes and persists."""
+    user = User(email="erin@example.com", username="erin", password_hash="x")
+    test_db.add(user)
+    await test_db.flush()
+
+    document = Document(user_id=user.id, title="Note", embedding=[0.1, 0.2, 0.3])
+    test_db.add(document)
+    await test_db.commit()
+
+    document.embedding = np.array([0.5, 0.25], dtype=np.float32)
+    await test_db.commit()
+
+    await test_db.refresh(document)
+    assert document.embedding is not None
+    np.testing.assert_array_equal(document.embedding, np.array([0.5, 0.25], dtype=np.float32))
@@ -0,0 +1,88 @@
+"""Schema helper tests."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas.common import CursorParams, HexColor, decode_cursor, encode_cursor
+from app.schemas.user import UserCreate
+
+
+def test_cursor_round_trip_yields_naive_utc() -> None:
+    """Cursors built from aware response values decode to naive UTC."""
+    row_id = uuid.uuid4()
+    stored = datetime(2024, 1, 2, 3, 4, 5, 678901)
+    aware = stored.replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=2)))
+
+    for sort_value in (stored, aware):
+        decoded_value, decoded_id = decode_cursor(encode_cursor(sort_value, row_id))
+        assert decoded_value == stored
+        assert decoded_value.tzinfo is None
+        assert decoded_id == row_id
+
+
+def test_cursor_params_reject_malformed_cursor() -> None:
+    """A bad cursor fails validation (a 422) instead of erroring in the query."""
+    for cursor in ("not-a-cursor", encode_cursor(datetime(2024, 1, 2), uuid.uuid4())[:-4]):
+        with pytest.raises(ValidationError, match="Invalid cursor"):
+            CursorParams(cursor=cursor)
+
+
+def test_cursor_params_position() -> None:
+    """The decoded position is available for valid cursors, None for the first page."""
+    row_id = uuid.uuid4()
+    params = CursorParams(cursor=encode_cursor(datetime(2024, 1, 2), row_id))
+    assert params.position == (datetime(2024, 1, 2), row_id)
+    assert CursorParams().position is None
+
+
+@pytest.mark.parametrize(
+    ("password", "error"),
+    [
+        ("lowercase1", "at least one uppercase letter"),
+        ("UPPERCASE1", "at least one lowercase letter"),
+        ("NoDigitsHere", "at least one digit"),
+    ],
+)
+def test_password_strength_reports_missing_class(password: str, error: str) -> None:
+    """Each missing character class gets its own error message."""
+    with pytest.raises(ValidationError, match=error):
+        UserCreate(email="frank@example.com", username="frank", password=password)
+
+
+def test_password_strength_accepts_non_ascii_letters() -> None:
+    """Case checks use Unicode semantics, like str.isupper()/islower()."""
+    for password in ("Ünïcode-pass1", "ÉCOLE-école1", "ΣΊΣΥΦΟΣ-σίσυφος1"):
+        assert UserCreate(email="frank@example.com", username="frank", password=password)
+
+
+@pytest.mark.parametrize("username", ["alice", "bob_42", "jean-luc", "zoë", "Łukasz", "名前です"])
+def test_username_accepts_unicode_letters_digits_underscores_hyphens(username: str) -> None:
+    """Usernames allow any str.isalnum() character plus "_" and "-"."""
+    user = UserCreate(email="gina@example.com", username=username, password="Correct-horse1")
+    assert user.username == username.lower()
+
+
+@pytest.mark.parametrize("username", ["has space", "dot.name", "at@sign", "___", "-_-"])
+def test_username_rejects_other_characters(username: str) -> None:
+    """Other characters, or no letter or digit at all, are rejected."""
+    with pytest.raises(ValidationError, match="Username can only contain"):
+        UserCreate(email="gina@example.com", username=username, password="Correct-horse1")
+
+
+def test_hex_color_round_trip() -> None:
+    """Colors parse from "#rrggbb" or "rrggbb" and serialize back as "#rrggbb"."""
+    adapter = TypeAdapter(HexColor)
+    for value in ("#1a2B3c", "1a2B3c"):
+        color = adapter.validate_python(value)
+        assert color == 0x1A2B3C
+        assert adapter.dump_python(color) == "#1a2b3c"
+
+
+@pytest.mark.parametrize("value", ["0x1234", "+12345", " 12345", "#12_345", "#12345", "#1234567"])
+def test_hex_color_rejects_loose_formats(value: str) -> None:
+    """Only exactly six hex digits, optionally prefixed with "#", are accepted."""
+    with pytest.raises(ValidationError, match="#rrggbb"):
+        TypeAdapter(HexColor).validate_python(value)
@@ -0,0 +1,15 @@
+"""Security utility tests."""
+
+from app.core.security import create_access_token, verify_token
+
+
+def test_verify_token_payload_mutation_does_not_leak() -> None:
+    """Changing a returned payload must not affect later verifications."""
+    token = create_access_token("00000000-0000-0000-0000-000000000001")
+
+    payload = verify_token(token)
+    assert payload is not None
+    payload["type"] = "refresh"
+
+    assert verify_token(token, token_type="refresh") is None
+    assert verify_token(token) is not None